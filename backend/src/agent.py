@@ -101,10 +101,14 @@ async def entrypoint(ctx: JobContext):
     # Metrics collection, to measure pipeline performance
     # For more information, see https://docs.livekit.io/agents/build/metrics/
     usage_collector = metrics.UsageCollector()
+    # log_metrics builds its log record on every event, so skip it when the
+    # livekit.agents logger would discard INFO records anyway
+    metrics_logger = logging.getLogger("livekit.agents")
 
     @session.on("metrics_collected")
     def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
+        if metrics_logger.isEnabledFor(logging.INFO):
+            metrics.log_metrics(ev.metrics)
         usage_collector.collect(ev.metrics)
 
     async def log_usage():